@@ -23,6 +23,8 @@ import com.theblackturtle.mutafuzz.httpfuzzer.wildcardfilter.WildcardFilter;
 import javax.swing.SwingUtilities;
 
 import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Collections;
 import java.util.HashMap;
 import java.util.List;
 import java.util.concurrent.CompletableFuture;
@@ -503,6 +505,19 @@ public class HttpFuzzerEngine {
         return originalRequest;
     }
 
+    /**
+     * Counts %s payload markers in the current request template.
+     * Scans the raw request bytes so scripts need not copy the template into Python.
+     *
+     * @return Number of %s markers, or -1 if no template is available
+     */
+    public int getCurrentTemplateMarkerCount() {
+        if (originalRequest == null) {
+            return -1;
+        }
+        return originalRequest.toByteArray().countMatches("%s");
+    }
+
     private synchronized void createHttpClientWithConfig() {
         closeHttpClient();
 
@@ -1002,6 +1017,43 @@ public class HttpFuzzerEngine {
         }
     }
 
+    /**
+     * Queues a batch of payload sets against the original request template.
+     * Template is serialized and normalized once for the whole batch instead of once per payload set.
+     * Elements that are not lists are treated as a single payload.
+     *
+     * @param payloadsBatch Payload sets, each injected at %s markers in sequence
+     * @param learn         Learn group ID (>= 1 enables learning, 0 or null disables)
+     */
+    public void queuePayloadsBatch(List<?> payloadsBatch, Integer learn) {
+        if (payloadsBatch == null || payloadsBatch.isEmpty()) {
+            return;
+        }
+
+        if (originalRequest == null) {
+            LOGGER.error("queuePayloadsBatch: Original request is null, skipping");
+            return;
+        }
+
+        String template = originalRequest.toString();
+        if (template == null) {
+            LOGGER.error("queuePayloadsBatch: Original request string is null, skipping");
+            return;
+        }
+        template = normalizeLineEndings(template);
+        HttpService service = getOriginalHttpService();
+
+        for (Object element : payloadsBatch) {
+            if (isStopped()) {
+                LOGGER.debug("queuePayloadsBatch: Engine stopped, dropping remaining batch");
+                return;
+            }
+
+            List<?> payloads = element instanceof List ? (List<?>) element : Collections.singletonList(element);
+            queueNormalizedTemplate(template, payloads, service, learn);
+        }
+    }
+
     /**
      * Queues request using raw HTTP template with payloads.
      * Template may contain %s markers for payload injection.
@@ -1017,19 +1069,33 @@ public class HttpFuzzerEngine {
             return;
         }
 
-        String processedTemplate = requestTemplate.replaceAll("\r?\n", "\r\n");
+        queueNormalizedTemplate(normalizeLineEndings(requestTemplate),
+                payloads != null ? Arrays.asList(payloads) : null, parseService(url), learn);
+    }
+
+    private static String normalizeLineEndings(String requestTemplate) {
+        return requestTemplate.replaceAll("\r?\n", "\r\n");
+    }
+
+    /**
+     * Injects payloads into a CRLF-normalized template and queues the resulting request.
+     * Shared by single and batched template queueing so both build requests identically.
+     */
+    private void queueNormalizedTemplate(String template, List<?> payloads, HttpService service, Integer learn) {
+        String processedTemplate = template;
 
         // Inject payloads if markers present
-        if (processedTemplate.contains("%s") && payloads != null) {
-            for (String payload : payloads) {
-                processedTemplate = StringUtils.replace(processedTemplate, "%s", payload, 1);
+        if (payloads != null && processedTemplate.contains("%s")) {
+            for (Object payload : payloads) {
+                processedTemplate = StringUtils.replace(processedTemplate, "%s",
+                        payload != null ? payload.toString() : null, 1);
             }
         }
         processedTemplate = processedTemplate.replace("HTTP/2", "HTTP/1.1");
 
         try {
             HttpRequest httpRequest = HttpRequest.httpRequest(processedTemplate);
-            httpRequest = httpRequest.withService(parseService(url));
+            httpRequest = httpRequest.withService(service);
             queueHttpRequest(httpRequest, learn);
         } catch (Exception e) {
             LOGGER.error("Error creating request from template: {}", e.getMessage(), e);
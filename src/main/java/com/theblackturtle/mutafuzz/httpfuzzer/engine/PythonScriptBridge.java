@@ -8,6 +8,7 @@ import org.slf4j.LoggerFactory;
 
 import java.nio.charset.StandardCharsets;
 import java.security.MessageDigest;
+import java.util.List;
 import java.util.Map;
 import java.util.concurrent.ConcurrentHashMap;
 
@@ -94,6 +95,17 @@ public class PythonScriptBridge {
         httpFuzzerEngine.queuePayloads(payloads, learn);
     }
 
+    /**
+     * Queues many payload sets in a single call using original request template.
+     * Avoids one Python-to-Java round-trip per payload set in tight loops.
+     *
+     * @param payloadsBatch List of payload sets (or single payloads), each injected at %s markers
+     * @param learn         Learn group ID (>= 1 enables learning, 0 disables)
+     */
+    public void queuePayloadsBatch(List<?> payloadsBatch, Integer learn) {
+        httpFuzzerEngine.queuePayloadsBatch(payloadsBatch, learn);
+    }
+
     /**
      * Queues fuzzing tasks with custom raw HTTP template and payloads.
      *
@@ -106,6 +118,74 @@ public class PythonScriptBridge {
         httpFuzzerEngine.queueRawTemplate(url, requestTemplate, payloads, learn);
     }
 
+    /**
+     * Dispatches queue() calls buffered by the Python side in a single call.
+     * Each entry is [kind, args...] where kind selects the queue method:
+     * "http" (request, learn), "url" (url, learn), "payloads" (payloads, learn)
+     * or "raw" (url, template, payloads, learn).
+     *
+     * @param batch Buffered queue entries in submission order
+     */
+    public void submitBatch(List<List<Object>> batch) {
+        if (batch == null) {
+            return;
+        }
+
+        for (List<Object> entry : batch) {
+            if (httpFuzzerEngine.isStopped()) {
+                LOGGER.debug("submitBatch: Engine stopped, dropping remaining entries");
+                return;
+            }
+
+            try {
+                submitEntry(entry);
+            } catch (Exception e) {
+                LOGGER.error("Error submitting queued entry: {}", e.getMessage(), e);
+            }
+        }
+    }
+
+    private void submitEntry(List<Object> entry) {
+        String kind = String.valueOf(entry.get(0));
+        switch (kind) {
+            case "http":
+                queueHttpRequest((HttpRequest) entry.get(1), toLearnGroup(entry.get(2)));
+                break;
+            case "url":
+                queueUrl(toStringOrNull(entry.get(1)), toLearnGroup(entry.get(2)));
+                break;
+            case "payloads":
+                queuePayloads(toStringArray(entry.get(1)), toLearnGroup(entry.get(2)));
+                break;
+            case "raw":
+                queueRawTemplate(toStringOrNull(entry.get(1)), toStringOrNull(entry.get(2)),
+                        toStringArray(entry.get(3)), toLearnGroup(entry.get(4)));
+                break;
+            default:
+                LOGGER.warn("submitBatch: Unknown queue entry kind: {}", kind);
+        }
+    }
+
+    private static Integer toLearnGroup(Object value) {
+        return value instanceof Number ? ((Number) value).intValue() : 0;
+    }
+
+    private static String toStringOrNull(Object value) {
+        return value != null ? value.toString() : null;
+    }
+
+    private static String[] toStringArray(Object value) {
+        if (!(value instanceof List)) {
+            return null;
+        }
+        List<?> values = (List<?>) value;
+        String[] result = new String[values.size()];
+        for (int i = 0; i < result.length; i++) {
+            result[i] = String.valueOf(values.get(i));
+        }
+        return result;
+    }
+
     /**
      * Send HTTP request synchronously and return response immediately.
      * Delegates to HttpFuzzerEngine for execution.
@@ -162,6 +242,15 @@ public class PythonScriptBridge {
         return httpFuzzerEngine.getCurrentTemplateRequest();
     }
 
+    /**
+     * Counts %s payload markers in the template editor request.
+     *
+     * @return Number of %s markers, or -1 if no template is available
+     */
+    public int getCurrentTemplateMarkerCount() {
+        return httpFuzzerEngine.getCurrentTemplateMarkerCount();
+    }
+
     /**
      * @return The underlying fuzzer engine for direct access to advanced features
      */
@@ -123,7 +123,11 @@ public class PythonScriptExecutor implements Runnable {
 
                     PyObject queueTasks = pythonInterpreter.get("queue_tasks");
                     if (queueTasks != null && queueTasks.isCallable()) {
-                        queueTasks.__call__();
+                        try {
+                            queueTasks.__call__();
+                        } finally {
+                            endQueueBatching();
+                        }
                     }
                 } else {
                     LOGGER.warn("No script provided");
@@ -136,6 +140,26 @@ public class PythonScriptExecutor implements Runnable {
         }
     }
 
+    /**
+     * Submits queue() calls still buffered by the Python 'fuzz' object and switches it to
+     * immediate submission. Runs after queue_tasks() even when it raised or never called
+     * fuzz.done(), so queued requests, including later ones from handle_response, are not held back.
+     */
+    private void endQueueBatching() {
+        try {
+            PyObject fuzz = pythonInterpreter.get("fuzz");
+            if (fuzz == null) {
+                return;
+            }
+            PyObject endBatching = fuzz.__findattr__("_end_batching");
+            if (endBatching != null && endBatching.isCallable()) {
+                endBatching.__call__();
+            }
+        } catch (Exception e) {
+            LOGGER.warn("Error flushing queued requests", e);
+        }
+    }
+
     /**
      * Signals shutdown and blocks until cleanup completes.
      * Invokes Python onStop callback if defined.
@@ -11,6 +11,7 @@ import com.theblackturtle.mutafuzz.util.WAFDetector;
 import com.theblackturtle.swing.requesttable.data.SimpleRequestRowObject;
 
 import java.util.List;
+import java.util.Locale;
 import java.util.regex.Matcher;
 import java.util.regex.Pattern;
 
@@ -36,6 +37,19 @@ public class RequestObject extends SimpleRequestRowObject {
      */
     private long responseTime;
 
+    /**
+     * Lazily decoded response body and its lowercase form.
+     * Stacked script filters read the body repeatedly; caching avoids re-decoding per access.
+     */
+    private String responseBodyCache;
+    private String responseBodyLowerCache;
+
+    /**
+     * Set once the response is offloaded to a temp file; body caches stay empty
+     * afterwards so table rows do not pull the body back onto the heap.
+     */
+    private boolean responseInTempFile = false;
+
     private static final Pattern TITLE_PATTERN = Pattern.compile("<title[^>]*>(.*?)</title>",
             Pattern.CASE_INSENSITIVE | Pattern.DOTALL);
 
@@ -131,7 +145,9 @@ public class RequestObject extends SimpleRequestRowObject {
         }
         if (this.httpResponse != null) {
             this.httpResponse = this.httpResponse.copyToTempFile();
+            this.responseInTempFile = true;
         }
+        clearResponseBodyCache();
     }
 
     @Override
@@ -185,6 +201,13 @@ public class RequestObject extends SimpleRequestRowObject {
      */
     public void setHttpResponse(HttpResponse httpResponse) {
         this.httpResponse = httpResponse;
+        this.responseInTempFile = false;
+        clearResponseBodyCache();
+    }
+
+    private void clearResponseBodyCache() {
+        this.responseBodyCache = null;
+        this.responseBodyLowerCache = null;
     }
 
     /**
@@ -206,15 +229,24 @@ public class RequestObject extends SimpleRequestRowObject {
 
     /**
      * Get response body as string.
+     * Decoded once and cached until the response changes (not cached once moved to a temp file).
      */
     public String getResponseBody() {
+        String body = responseBodyCache;
+        if (body != null) {
+            return body;
+        }
+
         if (httpResponse == null) {
             return "";
         }
 
-        String body = httpResponse.bodyToString();
+        body = httpResponse.bodyToString();
         if (body == null) {
-            return "";
+            body = "";
+        }
+        if (!responseInTempFile) {
+            responseBodyCache = body;
         }
         return body;
     }
@@ -255,6 +287,21 @@ public class RequestObject extends SimpleRequestRowObject {
         return getBody();
     }
 
+    /**
+     * Lowercase response body - creates req.textLower property.
+     * Cached so stacked case-insensitive filters lowercase the body only once.
+     */
+    public String getTextLower() {
+        String bodyLower = responseBodyLowerCache;
+        if (bodyLower == null) {
+            bodyLower = getResponseBody().toLowerCase(Locale.ROOT);
+            if (!responseInTempFile) {
+                responseBodyLowerCache = bodyLower;
+            }
+        }
+        return bodyLower;
+    }
+
     /**
      * Property-style access to content length.
      */
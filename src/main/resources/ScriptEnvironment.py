@@ -3,19 +3,57 @@
 import random
 import re
 import string
+import threading
+from itertools import chain, islice, repeat
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # Jython and stock CPython: stdlib parser
+    from json import loads as _json_loads
 
 # Variables injected by Java PythonScriptExecutor at runtime:
 # - burp_api: MontoyaApi instance
 # - handler: PythonScriptBridge instance
-# - _wordlist_1, _wordlist_2, _wordlist_3: Configured wordlists
+# - _wordlist_1, _wordlist_2, _wordlist_3: Configured wordlists (Java List<String>, proxied, not copied)
 # - _java_raw_http_list: HttpRequestResponse list (RAW_HTTP_LIST mode)
 
 _should_stop = False
 
+_ALPHA = string.ascii_lowercase
+_ALPHANUM = string.ascii_lowercase + string.digits
+
+_PATTERN_TYPE = type(re.compile(""))
+
+# queue() calls buffered in Python before one handler.submitBatch() call
+_SQ_CAPACITY = 256
+
+# Marks cached values that have not been fetched from Java yet (None is a valid value)
+_UNSET = object()
+
+
+def _status_codes(codes):
+    if isinstance(codes, slice):
+        codes = range(codes.start or 0, codes.stop, codes.step or 1)
+    elif isinstance(codes, int) or not hasattr(codes, "__iter__"):
+        codes = [codes]
+    return frozenset(codes)
+
+
+def _compile_pattern(pattern, ignore_case):
+    if isinstance(pattern, _PATTERN_TYPE):
+        if ignore_case and not pattern.flags & re.IGNORECASE:
+            return re.compile(pattern.pattern, pattern.flags | re.IGNORECASE)
+        return pattern
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
 
 class filter:
     """Response filter decorators. Stack decorators for complex logic.
 
+    The top decorator runs first, so put cheap checks (status, interesting,
+    length_range) above body checks (contains, matches), which fetch req.text.
+
     @filter.status([200])
     @filter.interesting()
     def handle_response(req): table.add(req)
@@ -23,14 +61,22 @@ class filter:
 
     @staticmethod
     def status(codes):
-        """Include only these status codes."""
-        if not isinstance(codes, (list, tuple)):
-            codes = [codes]
+        """Include only these status codes (int, list, set, range, or slice(200, 300))."""
+        codes = _status_codes(codes)
 
         def decorator(func):
-            def wrapper(req):
-                if req.status in codes:
-                    return func(req)
+            if len(codes) == 1:
+                (code,) = codes
+
+                def wrapper(req):
+                    if req.status == code:
+                        return func(req)
+
+            else:
+
+                def wrapper(req):
+                    if req.status in codes:
+                        return func(req)
 
             return wrapper
 
@@ -38,14 +84,22 @@ class filter:
 
     @staticmethod
     def status_not(codes):
-        """Exclude these status codes."""
-        if not isinstance(codes, (list, tuple)):
-            codes = [codes]
+        """Exclude these status codes (int, list, set, range, or slice(500, 600))."""
+        codes = _status_codes(codes)
 
         def decorator(func):
-            def wrapper(req):
-                if req.status not in codes:
-                    return func(req)
+            if len(codes) == 1:
+                (code,) = codes
+
+                def wrapper(req):
+                    if req.status != code:
+                        return func(req)
+
+            else:
+
+                def wrapper(req):
+                    if req.status not in codes:
+                        return func(req)
 
             return wrapper
 
@@ -81,12 +135,15 @@ class filter:
     @staticmethod
     def contains(*keywords):
         """Include only if body contains all keywords (case-insensitive)."""
+        lowered = tuple(kw.lower() for kw in keywords)
 
         def decorator(func):
             def wrapper(req):
-                body_lower = req.text.lower() if req.text else ""
-                if all(kw.lower() in body_lower for kw in keywords):
-                    return func(req)
+                body_lower = req.textLower
+                for kw in lowered:
+                    if kw not in body_lower:
+                        return None
+                return func(req)
 
             return wrapper
 
@@ -94,25 +151,87 @@ class filter:
 
     @staticmethod
     def matches(pattern, ignore_case=False):
-        """Include only if body matches regex pattern."""
+        """Include only if body matches regex pattern (str or re.compile() result)."""
+        compiled = _compile_pattern(pattern, ignore_case)
 
         def decorator(func):
             def wrapper(req):
-                flags = re.IGNORECASE if ignore_case else 0
-                body = req.text if req.text else ""
-                if re.search(pattern, body, flags):
+                if compiled.search(req.text or ""):
                     return func(req)
 
             return wrapper
 
         return decorator
 
+    @staticmethod
+    def compose(
+        status=None,
+        status_not=None,
+        interesting=False,
+        min_len=None,
+        max_len=None,
+        contains=None,
+        matches=None,
+        ignore_case=False,
+    ):
+        """Single decorator combining several filters (faster than stacking).
+
+        Criteria mirror the individual decorators; omitted ones are skipped.
+        Checks run cheapest-first (status, interesting, length, contains,
+        matches) and stop at the first failing one, so the body is only
+        fetched for responses that pass every metadata check.
+
+        @filter.compose(status=[200], interesting=True, min_len=1000, contains=("admin",))
+        def handle_response(req): table.add(req)
+        """
+        codes = _status_codes(status) if status is not None else None
+        excluded = _status_codes(status_not) if status_not is not None else None
+        check_status = codes is not None or excluded is not None
+        check_length = min_len is not None or max_len is not None
+        if contains is None:
+            lowered = ()
+        elif isinstance(contains, (list, tuple)):
+            lowered = tuple(kw.lower() for kw in contains)
+        else:
+            lowered = (contains.lower(),)
+        compiled = _compile_pattern(matches, ignore_case) if matches is not None else None
+
+        def decorator(func):
+            def wrapper(req):
+                if check_status:
+                    code = req.status
+                    if codes is not None and code not in codes:
+                        return None
+                    if excluded is not None and code in excluded:
+                        return None
+                if interesting and not req.interesting:
+                    return None
+                if check_length:
+                    length = req.length
+                    if min_len is not None and length < min_len:
+                        return None
+                    if max_len is not None and length > max_len:
+                        return None
+                if lowered:
+                    body_lower = req.textLower
+                    for kw in lowered:
+                        if kw not in body_lower:
+                            return None
+                if compiled is not None and not compiled.search(req.text or ""):
+                    return None
+                return func(req)
+
+            return wrapper
+
+        return decorator
+
 
 class QueueBuilder:
     """Fluent builder for fuzzing requests. Chain methods then call .queue() or .send()."""
 
-    def __init__(self, handler):
+    def __init__(self, handler, fuzz_api=None):
         self._handler = handler
+        self._fuzz_api = fuzz_api
         self._url = None
         self._template = None
         self._payloads = None
@@ -130,8 +249,13 @@ class QueueBuilder:
         return self
 
     def payloads(self, payloads):
-        """Set payloads to inject at %s markers."""
-        self._payloads = payloads if isinstance(payloads, list) else [payloads]
+        """Set payloads to inject at %s markers (list, tuple, or single payload).
+
+        Lists are copied when queued, so callers may reuse them; tuples are used as-is.
+        """
+        if not isinstance(payloads, (list, tuple)):
+            payloads = [payloads]
+        self._payloads = payloads
         return self
 
     def learn_group(self, group_id):
@@ -146,36 +270,61 @@ class QueueBuilder:
 
     def current_template(self):
         """Use request from template editor."""
-        self._http_request = self._handler.getCurrentTemplateRequest()
+        self._http_request = self._template_request()
         return self
 
+    def _template_request(self):
+        if self._fuzz_api is not None:
+            return self._fuzz_api._template_request()
+        return self._handler.getCurrentTemplateRequest()
+
+    def _template_string(self):
+        if self._fuzz_api is not None:
+            return self._fuzz_api._template_string()
+        current_req = self._handler.getCurrentTemplateRequest()
+        return current_req.toString() if current_req else None
+
     def queue(self):
-        """Queue request for async execution."""
+        """Queue request for async execution.
+
+        Not immediate: requests built via 'fuzz' are buffered and submitted in
+        batches. fuzz.flush(), send(), utils.sleep(), fuzz.done() and the end of
+        queue_tasks() (even when it raises) submit whatever is still buffered;
+        after done() or queue_tasks() returns, queue() submits immediately.
+        """
+        # Buffered entries must not share a list the caller may still mutate
+        payloads = tuple(self._payloads) if self._payloads else None
         if self._http_request:
-            self._handler.queueHttpRequest(self._http_request, self._learn_group)
+            self._submit(("http", self._http_request, self._learn_group))
         elif self._template:
-            self._handler.queueRawTemplate(
-                self._url, self._template, self._payloads, self._learn_group
+            self._submit(
+                ("raw", self._url, self._template, payloads, self._learn_group)
             )
-        elif self._payloads:
-            current_req = self._handler.getCurrentTemplateRequest()
-            if current_req:
-                template_str = current_req.toString()
-                self._handler.queueRawTemplate(
-                    None, template_str, self._payloads, self._learn_group
-                )
+        elif payloads:
+            template_str = self._template_string()
+            if template_str:
+                self._submit(("raw", None, template_str, payloads, self._learn_group))
             else:
-                self._handler.queuePayloads(self._payloads, self._learn_group)
+                self._submit(("payloads", payloads, self._learn_group))
         elif self._url:
-            self._handler.queueUrl(self._url, self._learn_group)
+            self._submit(("url", self._url, self._learn_group))
         return self
 
+    def _submit(self, entry):
+        if self._fuzz_api is not None:
+            self._fuzz_api._submit(entry)
+        else:
+            self._handler.submitBatch([entry])
+
     def send(self):
         """Send request synchronously, return RequestObject immediately.
 
         Blocks until response received. No callback, no learn mode, not auto-added to table.
         For payloads, sends only FIRST payload.
         """
+        # Buffered queue() calls go out first so request order is preserved
+        if self._fuzz_api is not None:
+            self._fuzz_api.flush()
         if self._http_request:
             return self._handler.sendHttpRequest(self._http_request)
         elif self._template:
@@ -199,31 +348,97 @@ class FuzzerAPI:
 
     def __init__(self, handler):
         self.handler = handler
+        self._current_template = _UNSET
+        self._current_template_str = None
+        self._sq = []
+        self._sq_capacity = _SQ_CAPACITY
+        self._sq_lock = threading.Lock()
 
     def url(self, url):
         """Start building request with URL."""
-        return QueueBuilder(self.handler).url(url)
+        return QueueBuilder(self.handler, self).url(url)
 
     def payloads(self, payloads):
         """Start building request with payloads."""
-        return QueueBuilder(self.handler).payloads(payloads)
+        return QueueBuilder(self.handler, self).payloads(payloads)
 
     def raw_request(self, template):
         """Start building request with raw HTTP template."""
-        return QueueBuilder(self.handler).raw_request(template)
+        return QueueBuilder(self.handler, self).raw_request(template)
 
     def http_request(self, request):
         """Start building request with HttpRequest object (full Montoya API control)."""
-        return QueueBuilder(self.handler).http_request(request)
+        return QueueBuilder(self.handler, self).http_request(request)
 
     def current_template(self):
         """Start building request from template editor."""
-        return QueueBuilder(self.handler).current_template()
+        return QueueBuilder(self.handler, self).current_template()
+
+    def queue_batch(self, payload_tuples, learn_group=0):
+        """Queue many payload sets against the template editor request in one call.
+
+        Equivalent to fuzz.payloads(p).learn_group(learn_group).queue() for each p.
+        Accepts any iterable of payload sets; generators are materialized here.
+        """
+        if not isinstance(payload_tuples, (list, tuple)):
+            payload_tuples = list(payload_tuples)
+        if payload_tuples:
+            self.flush()
+            self.handler.queuePayloadsBatch(payload_tuples, learn_group)
+
+    def queue_calibration(self, groups, marker_count=1):
+        """Queue learn-mode calibration payloads and submit them in one batch.
+
+        groups[n] holds payloads for learn group n + 1; each payload fills all
+        marker_count positions.
+        """
+        for group_id, group in enumerate(groups, 1):
+            for payload in group:
+                self.payloads((payload,) * marker_count).learn_group(group_id).queue()
+        self.flush()
+
+    def flush(self):
+        """Submit buffered queue() calls now (e.g. before waiting on calibration)."""
+        with self._sq_lock:
+            batch, self._sq = self._sq, []
+        if batch:
+            self.handler.submitBatch(batch)
 
     def done(self):
         """Signal no more tasks will be queued (call at end of queue_tasks())."""
+        self._end_batching()
+        self._current_template = _UNSET
+        self._current_template_str = None
         self.handler.done()
 
+    def _end_batching(self):
+        # Requests queued later (e.g. from handle_response) are submitted immediately
+        self._sq_capacity = 1
+        self.flush()
+
+    def _submit(self, entry):
+        with self._sq_lock:
+            self._sq.append(entry)
+            if len(self._sq) < self._sq_capacity:
+                return
+            batch, self._sq = self._sq, []
+        self.handler.submitBatch(batch)
+
+    def _template_request(self):
+        """Template editor request, fetched from Java once and cached until done()."""
+        if self._current_template is _UNSET:
+            self._current_template_str = None
+            self._current_template = self.handler.getCurrentTemplateRequest()
+        return self._current_template
+
+    def _template_string(self):
+        """Serialized template editor request (None without template), cached like the request."""
+        if self._current_template_str is None:
+            current_req = self._template_request()
+            if current_req:
+                self._current_template_str = current_req.toString()
+        return self._current_template_str
+
 
 fuzz = FuzzerAPI(handler)
 
@@ -338,12 +553,12 @@ class payloads:
 
     @staticmethod
     def all():
-        """Get all wordlists combined."""
-        result = []
-        result.extend(payloads._get_payloads_1())
-        result.extend(payloads._get_payloads_2())
-        result.extend(payloads._get_payloads_3())
-        return result
+        """Iterate all wordlists combined (lazy; wrap in list() for len/indexing)."""
+        return chain(
+            payloads._get_payloads_1(),
+            payloads._get_payloads_2(),
+            payloads._get_payloads_3(),
+        )
 
     @staticmethod
     def _get_payloads_1():
@@ -390,24 +605,31 @@ class utils:
     @staticmethod
     def randstr(length=12, digits=True):
         """Generate random string."""
-        candidates = string.ascii_lowercase
-        if digits:
-            candidates += string.digits
-        return "".join(random.choice(candidates) for _ in range(length))
+        candidates = _ALPHANUM if digits else _ALPHA
+        return "".join(map(random.choice, repeat(candidates, length)))
 
     @staticmethod
     def sleep(ms):
-        """Sleep for milliseconds."""
+        """Sleep for milliseconds (submits buffered queue() calls first)."""
+        fuzz.flush()
         if ms is None or ms <= 0:
             return
         handler.sleep(ms)
 
     @staticmethod
     def chunked(iterable, size):
-        """Split iterable into chunks of size."""
-        items = list(iterable)
-        for i in range(0, len(items), size):
-            yield items[i : i + size]
+        """Split iterable into chunks of size (consumed lazily)."""
+        it = iter(iterable)
+        while True:
+            batch = list(islice(it, size))
+            if not batch:
+                return
+            yield batch
+
+    @staticmethod
+    def json_loads(s):
+        """Parse JSON text (uses orjson when available, else stdlib json)."""
+        return _json_loads(s)
 
     @staticmethod
     def http_request_from_url(url):
@@ -419,6 +641,11 @@ class utils:
         """Get current HttpRequest from template editor"""
         return handler.getCurrentTemplateRequest()
 
+    @staticmethod
+    def template_marker_count():
+        """Count %s markers in template editor request (-1 if no template)."""
+        return handler.getCurrentTemplateMarkerCount()
+
 
 def shouldStop():
     """Check if script should stop."""
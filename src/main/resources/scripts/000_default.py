@@ -6,21 +6,26 @@ of duplicate/expected responses using learn mode.
 """
 
 import time
-from itertools import product
+from itertools import chain, product
 
 # Configuration options for payload generation
 UPPERCASE = False
 LOWERCASE = False
 UPPER_FIRST_CHAR = False
 
+# Number of payload combinations sent to Java per fuzz.queue_batch() call
+BATCH_SIZE = 1024
+
 
 # Response Handler - Uncomment filters as needed
-# @filter.contains("admin", "panel")
+# The top decorator runs first: keep body checks (contains/matches) last so
+# rejected responses never fetch req.text, or use a single @filter.compose(...)
+# @filter.status([200, 201, 202])
+# @filter.status_not([404, 500])
 # @filter.interesting()
 # @filter.length_range(min=1000, max=5000)
+# @filter.contains("admin", "panel")
 # @filter.matches(r"error|warning", ignore_case=True)
-# @filter.status([200, 201, 202])
-# @filter.status_not([404, 500])
 @filter.interesting()
 def handle_response(req):
     """
@@ -34,10 +39,21 @@ def handle_response(req):
 
 def get_marker_count():
     """Count payload positions (%s) in current template."""
-    template_req = utils.get_current_template()
-    if template_req:
-        return template_req.toString().count("%s")
-    return 1  # Default: single position
+    count = utils.template_marker_count()
+    return count if count >= 0 else 1  # Default: single position
+
+
+def get_transform():
+    """Pick payload transformation once from configuration flags (None if disabled)."""
+    # Native case methods on purpose: Jython backs them with java.lang.String,
+    # while unicode.translate() would do a Python dict lookup per character.
+    if UPPERCASE:
+        return lambda payload: payload.upper()
+    elif LOWERCASE:
+        return lambda payload: payload.lower()
+    elif UPPER_FIRST_CHAR:
+        return lambda payload: payload.capitalize()
+    return None
 
 
 def queue_tasks():
@@ -57,57 +73,46 @@ def queue_tasks():
 
     # Calibration phase (learn groups 1-5)
     # Learn mode automatically filters responses to show only interesting ones
-    for i in range(6, 12, 3):
-        # Learn group 1: random string
-        payload = utils.randstr(length=i)
-        fuzz.payloads([payload] * marker_count).learn_group(1).queue()
-
-        # Learn group 2: random with trailing slash
-        payload = utils.randstr(length=i) + "/"
-        fuzz.payloads([payload] * marker_count).learn_group(2).queue()
-
-        # Learn group 3: admin prefix
-        payload = "admin" + utils.randstr(length=i)
-        fuzz.payloads([payload] * marker_count).learn_group(3).queue()
-
-        # Learn group 4: .htaccess prefix
-        payload = ".htaccess" + utils.randstr(length=i)
-        fuzz.payloads([payload] * marker_count).learn_group(4).queue()
-
-        # Learn group 5: buffer overflow
-        payload = "A" * (1000 + i)
-        fuzz.payloads([payload] * marker_count).learn_group(5).queue()
+    lengths = range(6, 12, 3)
+    calibration_groups = [
+        [utils.randstr(length=i) for i in lengths],  # 1: random string
+        [utils.randstr(length=i) + "/" for i in lengths],  # 2: trailing slash
+        ["admin" + utils.randstr(length=i) for i in lengths],  # 3: admin prefix
+        [".htaccess" + utils.randstr(length=i) for i in lengths],  # 4: .htaccess prefix
+        ["A" * (1000 + i) for i in lengths],  # 5: buffer overflow
+    ]
+    fuzz.queue_calibration(calibration_groups, marker_count)
 
     time.sleep(2)
 
     # Main fuzzing phase with payload transformations
+    transform = get_transform()
     if marker_count > 1:
         # Battering ram mode: replicate each payload across all positions
-        all_payloads = []
-        for wordlist in wordlists:
-            all_payloads.extend(wordlist)
-
-        for payload in all_payloads:
-            # Apply transformations
-            if UPPERCASE:
-                payload = payload.upper()
-            elif LOWERCASE:
-                payload = payload.lower()
-            elif UPPER_FIRST_CHAR:
-                payload = payload.capitalize()
-
-            fuzz.payloads([payload] * marker_count).queue()
+        all_payloads = chain.from_iterable(wordlists)
+        if transform:
+            all_payloads = (transform(payload) for payload in all_payloads)
+
+        payload_sets = ((payload,) * marker_count for payload in all_payloads)
+        for batch in utils.chunked(payload_sets, BATCH_SIZE):
+            fuzz.queue_batch(batch)
     else:
         # Normal mode: different payloads per position
-        for combination in product(*wordlists):
-            # Apply transformations
-            if UPPERCASE:
-                combination = [item.upper() for item in combination]
-            elif LOWERCASE:
-                combination = [item.lower() for item in combination]
-            elif UPPER_FIRST_CHAR:
-                combination = [item.capitalize() for item in combination]
-
-            fuzz.payloads(list(combination)).queue()
+        if transform:
+            combinations = (
+                [transform(item) for item in combination]
+                for combination in product(*wordlists)
+            )
+        else:
+            combinations = product(*wordlists)
+
+        batch = []
+        for combination in combinations:
+            batch.append(combination)
+            if len(batch) >= BATCH_SIZE:
+                fuzz.queue_batch(batch)
+                batch = []
+
+        fuzz.queue_batch(batch)
 
     fuzz.done()
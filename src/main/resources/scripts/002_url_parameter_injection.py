@@ -9,15 +9,18 @@ MIN = 0
 MAX = 100
 STEP = 1
 ZFILL = 0  # Zero-padding: ZFILL=3 converts 5 to "005"
+BATCH_SIZE = 10000  # Payloads sent to Java per fuzz.queue_batch() call
 
 
 # Response Handler - Uncomment filters as needed
-# @filter.contains("admin", "panel")
+# The top decorator runs first: keep body checks (contains/matches) last so
+# rejected responses never fetch req.text, or use a single @filter.compose(...)
+# @filter.status([200, 201, 202])
+# @filter.status_not([404, 500])
 # @filter.interesting()
 # @filter.length_range(min=1000, max=5000)
+# @filter.contains("admin", "panel")
 # @filter.matches(r"error|warning", ignore_case=True)
-# @filter.status([200, 201, 202])
-# @filter.status_not([404, 500])
 def handle_response(req):
     """Add response to request table."""
     table.add(req)
@@ -25,8 +28,9 @@ def handle_response(req):
 
 def queue_tasks():
     """Generate numbers from MIN to MAX with optional zero-padding."""
-    for num in range(MIN, MAX, STEP):
-        payload = str(num).zfill(ZFILL) if ZFILL > 0 else str(num)
-        fuzz.payloads([payload]).queue()
+    fmt = "%%0%dd" % ZFILL if ZFILL > 0 else "%d"
+    numbers = ([fmt % num] for num in xrange(MIN, MAX, STEP))
+    for batch in utils.chunked(numbers, BATCH_SIZE):
+        fuzz.queue_batch(batch)
 
     fuzz.done()
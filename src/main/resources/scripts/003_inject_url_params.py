@@ -6,6 +6,7 @@ Example: /page?id=1&name=test becomes /page?id=PAYLOAD&name=test (2 requests)
 """
 
 from burp.api.montoya.http.message.params import HttpParameter, HttpParameterType
+from java.lang import RuntimeException
 
 # Manual URL encoding required (Burp Suite limitation)
 # https://github.com/PortSwigger/burp-extensions-montoya-api/issues/103
@@ -16,31 +17,38 @@ def queue_tasks():
     """Inject PAYLOAD into each URL parameter from context menu templates."""
     for req_resp in templates.all():
         request = req_resp.request()
+        if request is None:
+            continue
 
-        try:
-            all_params = request.parameters()
-            if not all_params:
+        all_params = request.parameters()
+        if not all_params:
+            continue
+
+        for param in all_params:
+            if param.type() != HttpParameterType.URL:
                 continue
 
-            for param in all_params:
-                if param.type() == HttpParameterType.URL:
-                    modified_req = request.withUpdatedParameters(
-                        HttpParameter.parameter(param.name(), PAYLOAD, param.type())
-                    )
-                    fuzz.http_request(modified_req).queue()
-        except:
-            pass
+            try:
+                modified_req = request.withUpdatedParameters(
+                    HttpParameter.parameter(param.name(), PAYLOAD, param.type())
+                )
+            except RuntimeException as e:
+                print_err("Skipping parameter %s: %s" % (param.name(), e))
+                continue
+            fuzz.http_request(modified_req).queue()
 
     fuzz.done()
 
 
 # Response Handler - Uncomment filters as needed
-# @filter.contains("admin", "panel")
+# The top decorator runs first: keep body checks (contains/matches) last so
+# rejected responses never fetch req.text, or use a single @filter.compose(...)
+# @filter.status([200, 201, 202])
+# @filter.status_not([404, 500])
 # @filter.interesting()
 # @filter.length_range(min=1000, max=5000)
+# @filter.contains("admin", "panel")
 # @filter.matches(r"error|warning", ignore_case=True)
-# @filter.status([200, 201, 202])
-# @filter.status_not([404, 500])
 def handle_response(req):
     """Add response to request table."""
     table.add(req)
@@ -7,12 +7,14 @@ Example: Creates GET request to URL with custom User-Agent header
 
 
 # Response Handler - Uncomment filters as needed
-# @filter.contains("admin", "panel")
+# The top decorator runs first: keep body checks (contains/matches) last so
+# rejected responses never fetch req.text, or use a single @filter.compose(...)
+# @filter.status([200, 201, 202])
+# @filter.status_not([404, 500])
 # @filter.interesting()
 # @filter.length_range(min=1000, max=5000)
+# @filter.contains("admin", "panel")
 # @filter.matches(r"error|warning", ignore_case=True)
-# @filter.status([200, 201, 202])
-# @filter.status_not([404, 500])
 def handle_response(req):
     """Add response to request table."""
     table.add(req)
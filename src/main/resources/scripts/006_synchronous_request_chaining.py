@@ -7,12 +7,14 @@ Example: Get UUID from /uuid, then send it as X-Request-ID header to /headers
 
 
 # Response Handler - Uncomment filters as needed
-# @filter.contains("admin", "panel")
+# The top decorator runs first: keep body checks (contains/matches) last so
+# rejected responses never fetch req.text, or use a single @filter.compose(...)
+# @filter.status([200, 201, 202])
+# @filter.status_not([404, 500])
 # @filter.interesting()
 # @filter.length_range(min=1000, max=5000)
+# @filter.contains("admin", "panel")
 # @filter.matches(r"error|warning", ignore_case=True)
-# @filter.status([200, 201, 202])
-# @filter.status_not([404, 500])
 def handle_response(req):
     """Add response to request table."""
     table.add(req)
@@ -20,16 +22,14 @@ def handle_response(req):
 
 def queue_tasks():
     """Send two requests synchronously: extract data from first, use in second."""
-    import json
-
     base_url = "https://httpbin.org"
 
     # Step 1: Send first request and wait for response
     req1 = utils.http_request_from_url(base_url + "/uuid")
     resp1 = fuzz.http_request(req1).send()  # Blocks until response
 
-    # Step 2: Extract data from first response
-    data = json.loads(resp1.body)
+    # Step 2: Extract data from first response (utils.json_loads picks the fastest parser)
+    data = utils.json_loads(resp1.body)
     request_id = data.get("uuid", "fallback-id")
 
     # Step 3: Use extracted data in second request